@@ -2,6 +2,23 @@
 #
 # SPDX-License-Identifier: MIT
 
+import os
+
 from setuptools import setup
 
-setup()
+ext_modules = []
+
+# Optionally compile the package with mypyc. This is off by default so that
+# the normal build is a pure-Python package that works everywhere.
+if os.environ.get("PERFECT_FREEHAND_USE_MYPYC", "0") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/perfect_freehand/__init__.py",
+            "src/perfect_freehand/vec.py",
+        ],
+        opt_level="3",
+    )
+
+setup(ext_modules=ext_modules)
@@ -11,9 +11,16 @@ the stroke which can be drawn.
 """
 
 __version__ = "1.2.0"
-__all__ = ["get_stroke", "get_stroke_points", "get_stroke_outline_points"]
-
-from math import pi
+__all__ = [
+    "get_stroke",
+    "get_stroke_points",
+    "get_stroke_outline_points",
+    "svg_path_from_stroke",
+]
+
+import warnings
+from itertools import chain, islice
+from math import cos, hypot, pi, sin
 from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 from . import vec
@@ -27,6 +34,21 @@ FIXED_PI = pi + 0.0001
 # This is the rate of change for simulated pressure. It could be an option.
 RATE_OF_PRESSURE_CHANGE = 0.275
 
+# The caps are always drawn by rotating a point through the same fixed angles,
+# so the (cos, sin) of each angle is calculated once here.
+_CORNER_ROTATIONS = tuple(
+    (cos(FIXED_PI * t), sin(FIXED_PI * t)) for t in (i / 13.0 for i in range(0, 14))
+)
+_START_CAP_ROTATIONS = _CORNER_ROTATIONS[1:]
+_DOT_ROTATIONS = tuple(
+    (cos(FIXED_PI * 2 * t), sin(FIXED_PI * 2 * t))
+    for t in (i / 13.0 for i in range(1, 14))
+)
+_END_CAP_ROTATIONS = tuple(
+    (cos(FIXED_PI * 3 * t), sin(FIXED_PI * 3 * t))
+    for t in (i / 29.0 for i in range(1, 30))
+)
+
 
 def default_easing(t: float) -> float:
     return t
@@ -50,6 +72,77 @@ def get_stroke_radius(
     return size * easing(0.5 - thinning * (0.5 - pressure))
 
 
+def _rotate_around(
+    A: T, C: T, rotations: Sequence[Tuple[float, float]]
+) -> List[Tuple[float, float]]:
+    """Rotate a point A around a center C by each of the precomputed
+    ``(cos, sin)`` pairs in rotations.
+
+    This gives the same results as calling :func:`vec.rotAround` once per
+    angle.
+    """
+    cx = C[0]
+    cy = C[1]
+    px = A[0] - cx
+    py = A[1] - cy
+    return [(px * c - py * s + cx, px * s + py * c + cy) for c, s in rotations]
+
+
+def _simplify(
+    points: List[Tuple[float, float]], tolerance: float
+) -> List[Tuple[float, float]]:
+    """Simplify a line using the Ramer-Douglas-Peucker algorithm.
+
+    Points are removed if they are within ``tolerance`` of the simplified
+    line. The first and last points are always kept.
+    """
+    if len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = True
+    keep[-1] = True
+
+    tolerance2 = tolerance * tolerance
+    segments = [(0, len(points) - 1)]
+    while segments:
+        first, last = segments.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx = bx - ax
+        dy = by - ay
+        length2 = dx * dx + dy * dy
+
+        # Find the point furthest from the segment between first and last
+        furthest = -1
+        furthest_dist2 = tolerance2
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if length2 > 0.0:
+                t = ((px - ax) * dx + (py - ay) * dy) / length2
+                if t < 0.0:
+                    t = 0.0
+                elif t > 1.0:
+                    t = 1.0
+                ex = ax + dx * t - px
+                ey = ay + dy * t - py
+            else:
+                ex = ax - px
+                ey = ay - py
+            dist2 = ex * ex + ey * ey
+            if dist2 > furthest_dist2:
+                furthest = i
+                furthest_dist2 = dist2
+
+        # If it's too far away to drop, keep it and check each side of it
+        if furthest >= 0:
+            keep[furthest] = True
+            segments.append((first, furthest))
+            segments.append((furthest, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
 def get_stroke(
     points: Sequence[Union[T, InputPoint]],
     *,
@@ -58,6 +151,7 @@ def get_stroke(
     last: bool = False,
     thinning: float = 0.5,
     smoothing: float = 0.5,
+    simplify: bool = False,
     easing: Callable[[float], float] = default_easing,
     simulate_pressure: bool = True,
     cap_start: bool = True,
@@ -83,6 +177,10 @@ def get_stroke(
     :param last: Whether to handle the points as a completed stroke.
     :param thinning: The effect of pressure on the stroke's size.
     :param smoothing: How much to soften the stroke's edges.
+    :param simplify: Whether to simplify the outline, removing points that are
+        within ``size * smoothing / 4`` of a straight line through their
+        neighbours. This makes the outline much smaller on straight sections
+        of the stroke.
     :param easing: An easing function to apply to each point's pressure.
     :param simulate_pressure: Whether to simulate pressure based on velocity.
     :param cap_start: Whether to draw a round cap at the start of the line.
@@ -108,6 +206,7 @@ def get_stroke(
         size=size,
         thinning=thinning,
         smoothing=smoothing,
+        simplify=simplify,
         last=last,
         easing=easing,
         simulate_pressure=simulate_pressure,
@@ -151,33 +250,47 @@ def get_stroke_points(
     # Find the interpolation level between points
     t: float = 0.15 + (1.0 - streamline) * 0.85
 
-    # Convert the input to a list of tuples regardless of input type
-    pts: List[T] = list(
-        point
-        if isinstance(point, Sequence)
-        else (point["x"], point["y"], point["pressure"])
-        if "pressure" in point
-        else (point["x"], point["y"], 0.5)
+    # Convert the input to a list of (x, y, pressure) tuples regardless of input
+    # type, filling in the default pressure, so that the loop below can unpack
+    # each point without checking it. Checking for a dict is much cheaper than
+    # an isinstance() check against the Sequence ABC, and this runs once per
+    # input point.
+    pts: List[T] = [
+        (
+            (point["x"], point["y"], point.get("pressure", 0.5))
+            if isinstance(point, dict)
+            else (
+                point
+                if len(point) == 3
+                else (point[0], point[1], point[2] if len(point) > 2 else 0.5)
+            )
+        )
         for point in points
-    )
+    ]
+
+    # The first point is the exception: without a pressure, it uses 0.25.
+    if isinstance(points[0], dict) or len(points[0]) > 2:
+        first_pressure = pts[0][2]
+    else:
+        first_pressure = 0.25
 
     # Add extra points between the two, to help avoid "dash" lines
     # for strokes with tapered start and ends. Don't mutate the
     # input array!
     if len(pts) == 2:
         last_pt = pts.pop()
-        pts.extend(vec.lrp(pts[0], last_pt, i / 4.0) for i in range(1, 5))
+        pts.extend((*vec.lrp(pts[0], last_pt, i / 4.0), 0.5) for i in range(1, 5))
 
     # If there's only one point, add another point at a 1pt offset.
     if len(pts) == 1:
-        pts.append(vec.add(pts[0], (1.0, 1.0, 0.0)))
+        pts.append((pts[0][0] + 1.0, pts[0][1] + 1.0, 0.5))
 
     # The stroke_points array will hold the points for the stroke.
     # Start it out with the first point, which needs no adjustment.
     stroke_points: List[StrokePoint] = [
         StrokePoint(
             point=(pts[0][0], pts[0][1]),
-            pressure=pts[0][2] if len(pts[0]) > 2 else 0.25,
+            pressure=first_pressure,
             vector=(1.0, 1.0),
             distance=0.0,
             running_length=0.0,
@@ -191,28 +304,43 @@ def get_stroke_points(
     running_length = 0.0
 
     # We've set this to the latest point, so we can use it to calculate
-    # the distance and vector of the next point.
-    prev = stroke_points[0]
+    # the distance and vector of the next point. The position is tracked as
+    # plain floats, and the vector math below is written out rather than using
+    # the helpers in vec, since this loop runs once per input point.
+    prev_x, prev_y = stroke_points[0].point
 
     max = len(pts) - 1
 
-    for i in range(1, len(pts)):
+    # Bind the globals used in the loop below to locals. Before Python 3.11,
+    # each use of a global inside a loop is a fresh dict lookup.
+    _hypot = hypot
+
+    # Creating the StrokePoint with tuple.__new__ (as namedtuple's _make() does)
+    # skips the keyword argument handling in the generated __new__, which is
+    # several times slower. The fields must be in declaration order.
+    new_tuple = tuple.__new__
+
+    for i, (input_x, input_y, pressure) in enumerate(islice(pts, 1, None), 1):
         if last and i == max:
             # If we're at the last point and the last option is true,
             # then add the actual input point.
-            point = (pts[i][0], pts[i][1])
+            x = input_x
+            y = input_y
         else:
             # Otherwise, using the t calculated from the streamline
             # option, interpolate a new point between the previous
             # point and the current point.
-            point = vec.lrp(prev["point"], pts[i], t)
+            x = prev_x + (input_x - prev_x) * t
+            y = prev_y + (input_y - prev_y) * t
 
         # If the new point is the same as the previous point, skip ahead
-        if prev["point"] == point:
+        if x == prev_x and y == prev_y:
             continue
 
         # How far is the new point from the previous point?
-        distance = vec.dist(point, prev["point"])
+        dx = prev_x - x
+        dy = prev_y - y
+        distance = _hypot(dx, dy)
 
         # Add this distance to the total "running length" of the line.
         running_length += distance
@@ -225,23 +353,31 @@ def get_stroke_points(
             has_reached_minimum_length = True
             # TODO: Backfill the missing points so that tapering works correctly.
 
-        # Create a new strokepoint (it will be the new "previous" one).
-        prev = StrokePoint(
-            point=point,
-            pressure=pts[i][2] if len(pts[i]) > 2 else 0.5,
-            vector=vec.uni(vec.sub(prev["point"], point)),
-            distance=distance,
-            running_length=running_length,
+        # Create a new strokepoint and push it to the stroke_points array.
+        # The vector is the unit vector pointing back to the previous point,
+        # which reuses the distance we already calculated.
+        stroke_points.append(
+            new_tuple(
+                StrokePoint,
+                (
+                    (x, y),  # point
+                    pressure,
+                    (dx / distance, dy / distance),  # vector
+                    distance,
+                    running_length,
+                ),
+            )
         )
 
-        # Push it to the stroke_points array.
-        stroke_points.append(prev)
+        # It will be the new "previous" point.
+        prev_x = x
+        prev_y = y
 
     # Set the vector of the first point to be the same as the second point
     if len(stroke_points) > 1:
-        stroke_points[0]["vector"] = stroke_points[1]["vector"]
+        stroke_points[0] = stroke_points[0]._replace(vector=stroke_points[1].vector)
     else:
-        stroke_points[0]["vector"] = (0.0, 0.0)
+        stroke_points[0] = stroke_points[0]._replace(vector=(0.0, 0.0))
 
     return stroke_points
 
@@ -252,6 +388,7 @@ def get_stroke_outline_points(
     size: float = 16.0,
     thinning: float = 0.5,
     smoothing: float = 0.5,
+    simplify: bool = False,
     easing: Callable[[float], float] = default_easing,
     simulate_pressure: bool = True,
     last: bool = False,
@@ -269,6 +406,10 @@ def get_stroke_outline_points(
     :param size: The base size (diameter) of the stroke.
     :param thinning: The effect of pressure on the stroke's size.
     :param smoothing: How much to soften the stroke's edges.
+    :param simplify: Whether to simplify the outline, removing points that are
+        within ``size * smoothing / 4`` of a straight line through their
+        neighbours. This makes the outline much smaller on straight sections
+        of the stroke.
     :param easing: An easing function to apply to each point's pressure.
     :param simulate_pressure: Whether to simulate pressure based on velocity.
     :param last: Whether to handle the points as a completed stroke.
@@ -292,7 +433,26 @@ def get_stroke_outline_points(
     if len(points) == 0 or size <= 0.0:
         return []
 
-    total_length = points[-1]["running_length"]
+    # Stroke points used to be dicts, so convert any that are passed in.
+    if isinstance(points[0], dict):
+        warnings.warn(
+            "Passing stroke points as dicts is deprecated, "
+            "use the StrokePoint values returned by get_stroke_points",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        points = [
+            StrokePoint(
+                point=p["point"],
+                pressure=p["pressure"],
+                vector=p["vector"],
+                distance=p["distance"],
+                running_length=p["running_length"],
+            )
+            for p in points
+        ]
+
+    total_length = points[-1].running_length
 
     if isinstance(taper_start, bool):
         if taper_start:
@@ -316,14 +476,16 @@ def get_stroke_outline_points(
     # Previous pressure (start with average of first five pressures,
     # in order to prevent fat starts for every line. Drawn lines
     # almost always start slow!)
-    prev_pressure = points[0]["pressure"]
+    prev_pressure = points[0].pressure
     for point_i in points[0:10]:
-        pressure = point_i["pressure"]
+        pressure = point_i.pressure
         if simulate_pressure:
             # Speed of change - how fast should the pressure change?
-            sp = min(1.0, point_i["distance"] / size)
-            # Rate of change - how much of a change is there?
-            rp = min(1.0, 1.0 - sp)
+            sp = min(1.0, point_i.distance / size)
+            # Rate of change - how much of a change is there? Since the
+            # distance and size are both positive, sp is in [0, 1] and this
+            # can't be more than 1.
+            rp = 1.0 - sp
             # Accelerate the pressure
             pressure = min(
                 1.0,
@@ -333,40 +495,61 @@ def get_stroke_outline_points(
         prev_pressure = (prev_pressure + pressure) / 2
 
     # The current radius
-    radius = get_stroke_radius(size, thinning, points[-1]["pressure"], easing)
+    radius = get_stroke_radius(size, thinning, points[-1].pressure, easing)
+
+    # With the default easing, the radius is a linear function of the pressure,
+    # so fold the constants from get_stroke_radius() to avoid a call per point.
+    linear_radius = easing is default_easing
+    radius_base = size * (0.5 - 0.5 * thinning)
+    radius_scale = size * thinning
 
     # The radius of the first saved point
     first_radius: Optional[float] = None
 
     # Previous vector
-    prev_vector = points[0]["vector"]
+    prev_vector = points[0].vector
 
-    # Previous left and right points
-    pl = points[0]["point"]
-    pr = pl
-
-    # Temporary left and right points
-    tl = pl
-    tr = pr
+    # Previous left and right points. These are kept as plain floats so that
+    # a tuple only needs to be created for points that are actually added.
+    pl_x, pl_y = points[0].point
+    pr_x = pl_x
+    pr_y = pl_y
 
     # Keep track of whether the previous point is a sharp corner
     # ... so that we don't detect the same corner twice
     is_prev_point_sharp_corner = False
 
+    # Bind the globals and builtins used in the loop below to locals. Before
+    # Python 3.11, each use of a global inside a loop is a fresh dict lookup.
+    _min = min
+    _max = max
+    rate_of_pressure_change = RATE_OF_PRESSURE_CHANGE
+
+    last_index = len(points) - 1
+
+    # Removes noise from the end of the line
+    #
+    # Points (other than the last one) that are within 3 units of the end of
+    # the line are skipped. The running length never decreases, so these are
+    # always a run of points just before the last point; find where it starts
+    # up front instead of checking every point in the loop.
+    noise_index = last_index
+    while noise_index > 0 and total_length - points[noise_index - 1].running_length < 3:
+        noise_index -= 1
+
     # Find the outline's left and right points
     #
     # Iterating through the points and populate the right_pts and left_pts arrays,
     # skipping the first and last points, which will get caps later on.
-    for i, point_i in enumerate(points):
-        pressure = point_i["pressure"]
-        point = point_i["point"]
-        vector = point_i["vector"]
-        distance = point_i["distance"]
-        running_length = point_i["running_length"]
-
-        # Removes noise from the end of the line
-        if i < len(points) - 1 and total_length - running_length < 3:
-            continue
+    #
+    # This has to be a single sequential pass: the simulated pressure, and so
+    # the radius, depends on the previous point's pressure, and whether a point
+    # is added depends on the last point that was added to that side.
+    for i in chain(range(noise_index), (last_index,)):
+        point, pressure, vector, distance, running_length = points[i]
+
+        # How far this point is from the end of the line
+        remaining_length = total_length - running_length
 
         # Calculate the radius
         #
@@ -378,15 +561,18 @@ def get_stroke_outline_points(
                 # If we're simulating pressure, then do so based on the distance
                 # between the current point and the previous point, and the size
                 # of the stroke. Otherwise use the input pressure.
-                sp = min(1.0, distance / size)
-                rp = min(1.0, 1.0 - sp)
-                pressure = min(
+                sp = _min(1.0, distance / size)
+                rp = 1.0 - sp
+                pressure = _min(
                     1.0,
                     prev_pressure
-                    + (rp - prev_pressure) * (sp * RATE_OF_PRESSURE_CHANGE),
+                    + (rp - prev_pressure) * (sp * rate_of_pressure_change),
                 )
 
-            radius = get_stroke_radius(size, thinning, pressure, easing)
+            if linear_radius:
+                radius = radius_base + radius_scale * pressure
+            else:
+                radius = size * easing(0.5 - thinning * (0.5 - pressure))
         else:
             radius = size / 2.0
 
@@ -397,18 +583,22 @@ def get_stroke_outline_points(
         #
         # If the current length is within the taper distance at either the
         # start or the end, calculate the taper strengths. Apply the smaller
-        # of the two taper strengths to the radius.
-        if running_length < taper_start:
-            ts = taper_start_ease(running_length / taper_start)
+        # of the two taper strengths to the radius. Most points are outside of
+        # both tapers, so skip straight to the minimum radius for those.
+        if running_length < taper_start or remaining_length < taper_end:
+            if running_length < taper_start:
+                ts = taper_start_ease(running_length / taper_start)
+            else:
+                ts = 1.0
+
+            if remaining_length < taper_end:
+                te = taper_end_ease(remaining_length / taper_end)
+            else:
+                te = 1.0
+
+            radius = _max(0.01, radius * _min(ts, te))
         else:
-            ts = 1.0
-
-        if total_length - running_length < taper_end:
-            te = taper_end_ease((total_length - running_length) / taper_end)
-        else:
-            te = 1.0
-
-        radius = max(0.01, radius * min(ts, te))
+            radius = _max(0.01, radius)
 
         # Add points to left and right
 
@@ -417,32 +607,40 @@ def get_stroke_outline_points(
         # Find the difference (dot product) between the current and next vector.
         # If the next vector is at more than a right angle to the current vector,
         # draw a cap at the current point.
-        next_vector = (
-            points[i + 1]["vector"] if i < len(points) - 1 else points[i]["vector"]
-        )
-        next_dpr = vec.dpr(vector, next_vector) if i < len(points) - 1 else 1.0
-        prev_dpr = vec.dpr(vector, prev_vector)
+        vx, vy = vector
+        if i < last_index:
+            next_vector = points[i + 1].vector
+            next_dpr = vx * next_vector[0] + vy * next_vector[1]
+        else:
+            next_vector = vector
+            next_dpr = 1.0
+        prev_dpr = vx * prev_vector[0] + vy * prev_vector[1]
 
         is_point_sharp_corner = prev_dpr < 0 and not is_prev_point_sharp_corner
         is_next_point_sharp_corner = next_dpr < 0
 
+        x, y = point
+
         if is_point_sharp_corner or is_next_point_sharp_corner:
             # It's a sharp corner. Draw a rounded cap and move on to the next point
             # Considering saving these and drawing them later? So that we can avoid
             # crossing future points.
-            offset = vec.mul(vec.per(prev_vector), radius)
-
-            for i in range(0, 14):
-                t = i / 13.0
-
-                tl = vec.rotAround(vec.sub(point, offset), point, FIXED_PI * t)
-                left_pts.append(tl)
-
-                tr = vec.rotAround(vec.add(point, offset), point, FIXED_PI * -t)
-                right_pts.append(tr)
-
-            pl = tl
-            pr = tr
+            #
+            # The cap rotates the offset points on either side of the point by
+            # the same angles in opposite directions, so both sides are drawn
+            # together from the same products.
+            ox = prev_vector[1] * radius
+            oy = -prev_vector[0] * radius
+            for c, s in _CORNER_ROTATIONS:
+                oxc = ox * c
+                oys = oy * s
+                oxs = ox * s
+                oyc = oy * c
+                left_pts.append((x - oxc + oys, y - oxs - oyc))
+                right_pts.append((x + oxc + oys, y - oxs + oyc))
+
+            pl_x, pl_y = left_pts[-1]
+            pr_x, pr_y = right_pts[-1]
 
             if is_next_point_sharp_corner:
                 is_prev_point_sharp_corner = True
@@ -452,10 +650,11 @@ def get_stroke_outline_points(
         is_prev_point_sharp_corner = False
 
         # Handle the last point
-        if i == len(points) - 1:
-            offset = vec.mul(vec.per(vector), radius)
-            left_pts.append(vec.sub(point, offset))
-            right_pts.append(vec.add(point, offset))
+        if i == last_index:
+            ox = vy * radius
+            oy = -vx * radius
+            left_pts.append((x - ox, y - oy))
+            right_pts.append((x + ox, y + oy))
             continue
 
         # Add regular points
@@ -465,38 +664,56 @@ def get_stroke_outline_points(
         # previous point on that side is greater than the minimum distance
         # (or if the corner is kinda sharp), add the points to the side's
         # points array.
-        offset = vec.mul(vec.per(vec.lrp(next_vector, vector, next_dpr)), radius)
-
-        tl = vec.sub(point, offset)
-        if i <= 1 or vec.dist2(pl, tl) > min_distance:
-            left_pts.append(tl)
-            pl = tl
-
-        tr = vec.add(point, offset)
-        if i <= 1 or vec.dist2(pr, tr) > min_distance:
-            right_pts.append(tr)
-            pr = tr
+        #
+        # The offset is the perpendicular of the current vector interpolated
+        # towards the next one, scaled by the radius. The vector math is
+        # written out here rather than using vec, since this is the hot path.
+        nvx, nvy = next_vector
+        ox = (nvy + (vy - nvy) * next_dpr) * radius
+        oy = -(nvx + (vx - nvx) * next_dpr) * radius
+
+        tl_x = x - ox
+        tl_y = y - oy
+        dx = pl_x - tl_x
+        dy = pl_y - tl_y
+        if i <= 1 or dx * dx + dy * dy > min_distance:
+            left_pts.append((tl_x, tl_y))
+            pl_x = tl_x
+            pl_y = tl_y
+
+        tr_x = x + ox
+        tr_y = y + oy
+        dx = pr_x - tr_x
+        dy = pr_y - tr_y
+        if i <= 1 or dx * dx + dy * dy > min_distance:
+            right_pts.append((tr_x, tr_y))
+            pr_x = tr_x
+            pr_y = tr_y
 
         # Set variables for next iteration
         prev_pressure = pressure
         prev_vector = vector
 
+    # Simplify the left and right sides, if requested. The first point on
+    # each side is always kept, so the start cap is unchanged.
+    if simplify:
+        tolerance = max(0.0, size * smoothing * 0.25)
+        left_pts = _simplify(left_pts, tolerance)
+        right_pts = _simplify(right_pts, tolerance)
+
     # Drawing caps
     #
     # Now that we have our points on either side of the line, we need to
     # draw caps at the start and end. Tapered lines don't have caps, but
     # may have dots for very short lines.
 
-    first_point = points[0]["point"]
+    first_point = points[0].point
 
     if len(points) > 1:
-        last_point = points[-1]["point"]
+        last_point = points[-1].point
     else:
         last_point = vec.add(first_point, (1.0, 1.0))
 
-    start_cap: List[Tuple[float, float]] = []
-    end_cap: List[Tuple[float, float]] = []
-
     # Draw a dot for very short or completed strokes
     #
     # If the line is too short to gather left or right points and if the line is
@@ -507,6 +724,11 @@ def get_stroke_outline_points(
     if first_radius is None:
         first_radius = radius
 
+    # Otherwise, the points are returned in the correct winding order: begin on
+    # the left side, then continue around the end cap, then come back along the
+    # right side, and finally complete the start cap. The caps are added to the
+    # end of left_pts as they are drawn, rather than collected separately.
+
     if len(points) == 1:
         if not (taper_start or taper_end) or last:
             start = vec.prj(
@@ -514,12 +736,40 @@ def get_stroke_outline_points(
                 vec.uni(vec.per(vec.sub(first_point, last_point))),
                 -first_radius,
             )
-            dot_pts: List[Tuple[float, float]] = []
-            for i in range(1, 14):
-                t = i / 13.0
-                dot_pts.append(vec.rotAround(start, first_point, FIXED_PI * 2 * t))
-            return dot_pts
+            return _rotate_around(start, first_point, _DOT_ROTATIONS)
+
+        left_pts.extend(reversed(right_pts))
     else:
+        # Draw an end cap
+        #
+        # If the line does not have a tapered end, and unless the line has a tapered
+        # start and the line is very short, draw a cap around the last point. Finally,
+        # remove the last left and right points. Otherwise, add the last point. Note
+        # that this cap is a full-turn-and-a-half: this prevents incorrect caps on
+        # sharp end turns.
+
+        direction = vec.per(vec.neg(points[-1].vector))
+
+        if taper_end or (taper_start and len(points) == 1):
+            # Tapered end - push the last point to the line
+            left_pts.append(last_point)
+        elif cap_end:
+            # Draw the round end cap
+            start = vec.prj(last_point, direction, radius)
+            left_pts.extend(_rotate_around(start, last_point, _END_CAP_ROTATIONS))
+        else:
+            # Draw the flat end cap
+            left_pts.append(vec.add(last_point, vec.mul(direction, radius)))
+            left_pts.append(vec.add(last_point, vec.mul(direction, radius * 0.99)))
+            left_pts.append(vec.sub(last_point, vec.mul(direction, radius * 0.99)))
+            left_pts.append(vec.sub(last_point, vec.mul(direction, radius)))
+
+        # Come back along the right side. The first left and right points are
+        # still at the start of their lists for drawing the start cap. (Building
+        # right_pts in reverse, e.g. with deque.appendleft(), is no faster than
+        # extending from the reversed() iterator, which doesn't copy the list.)
+        left_pts.extend(reversed(right_pts))
+
         # Draw a start cap
         #
         # Unless the line has a tapered start, or unless the line has a tapered end
@@ -532,51 +782,52 @@ def get_stroke_outline_points(
             pass
         elif cap_start:
             # Draw the round cap - add thirteen points rotating the right point around the start point to the left point
-            for i in range(1, 14):
-                t = i / 13.0
-                pt = vec.rotAround(right_pts[0], first_point, FIXED_PI * t)
-                start_cap.append(pt)
+            left_pts.extend(
+                _rotate_around(right_pts[0], first_point, _START_CAP_ROTATIONS)
+            )
         else:
             # Draw the flat cap - add a point to the left and right of the start point
             corners_vector = vec.sub(left_pts[0], right_pts[0])
             offset_a = vec.mul(corners_vector, 0.5)
             offset_b = vec.mul(corners_vector, 0.51)
 
-            start_cap.append(vec.sub(first_point, offset_a))
-            start_cap.append(vec.sub(first_point, offset_b))
-            start_cap.append(vec.add(first_point, offset_b))
-            start_cap.append(vec.add(first_point, offset_a))
+            left_pts.append(vec.sub(first_point, offset_a))
+            left_pts.append(vec.sub(first_point, offset_b))
+            left_pts.append(vec.add(first_point, offset_b))
+            left_pts.append(vec.add(first_point, offset_a))
 
-        # Draw an end cap
-        #
-        # If the line does not have a tapered end, and unless the line has a tapered
-        # start and the line is very short, draw a cap around the last point. Finally,
-        # remove the last left and right points. Otherwise, add the last point. Note
-        # that this cap is a full-turn-and-a-half: this prevents incorrect caps on
-        # sharp end turns.
+    return left_pts
 
-        direction = vec.per(vec.neg(points[-1]["vector"]))
 
-        if taper_end or (taper_start and len(points) == 1):
-            # Tapered end - push the last point to the line
-            end_cap.append(last_point)
-        elif cap_end:
-            # Draw the round end cap
-            start = vec.prj(last_point, direction, radius)
-            for i in range(1, 30):
-                t = i / 29.0
-                end_cap.append(vec.rotAround(start, last_point, FIXED_PI * 3 * t))
-        else:
-            # Draw the flat end cap
-            end_cap.append(vec.add(last_point, vec.mul(direction, radius)))
-            end_cap.append(vec.add(last_point, vec.mul(direction, radius * 0.99)))
-            end_cap.append(vec.sub(last_point, vec.mul(direction, radius * 0.99)))
-            end_cap.append(vec.sub(last_point, vec.mul(direction, radius)))
-
-    # Return the points in the correct winding order: begin on the left side, then
-    # continue around the end cap, then come back along the right side, and finally
-    # complete the start cap.
-    left_pts.extend(end_cap)
-    left_pts.extend(reversed(right_pts))
-    left_pts.extend(start_cap)
-    return left_pts
+def svg_path_from_stroke(stroke: Sequence[Sequence[float]]) -> str:
+    """Convert the outline points of a stroke into SVG path data.
+
+    The outline is drawn as a closed path of quadratic curves through the
+    midpoints between the outline points. The path must be rendered using
+    ``fill-rule="nonzero"``.
+
+    :param stroke: A sequence of points, as returned from :func:`get_stroke`
+        or :func:`get_stroke_outline_points`.
+    :return: A string that can be used as the ``d`` attribute of an SVG
+        ``path`` element.
+    """
+    if len(stroke) == 0:
+        return ""
+
+    x0 = stroke[0][0]
+    y0 = stroke[0][1]
+
+    # Each curve segment goes to the midpoint between two outline points, using
+    # the second point as the end point, wrapping around to close the path.
+    d = [f"M {x0} {y0} Q"]
+    px = x0
+    py = y0
+    for point in chain(islice(stroke, 1, None), (stroke[0],)):
+        x = point[0]
+        y = point[1]
+        d.append(f"{(px + x) / 2} {(py + y) / 2} {x} {y}")
+        px = x
+        py = y
+    d.append("Z")
+
+    return " ".join(d)
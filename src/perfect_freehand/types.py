@@ -5,7 +5,8 @@
 
 """Support types for Python type hints."""
 
-from typing import Tuple, TypedDict
+import warnings
+from typing import Any, NamedTuple, SupportsIndex, Tuple, TypedDict, Union, overload
 
 
 class InputPoint(TypedDict, total=False):
@@ -26,12 +27,16 @@ class InputPoint(TypedDict, total=False):
     """The stylus pressure associated with the point. Optional."""
 
 
-class StrokePoint(TypedDict):
-    """The structure of a point dict that is the output from
+class StrokePoint(NamedTuple):
+    """The structure of a point that is the output from
     :func:`.get_stroke_points`
 
-    This ``TypedDict`` class is only used for typechecking; the returned
-    points are accessed in the same way as a normal dict.
+    The fields are accessed as attributes, e.g. ``point.pressure``.
+
+    .. note::
+        Stroke points used to be dicts. Reading the fields by name, e.g.
+        ``point["pressure"]``, still works but is deprecated, and will be
+        removed in a future release.
     """
 
     point: Tuple[float, float]
@@ -40,11 +45,33 @@ class StrokePoint(TypedDict):
     pressure: float
     """The stylus pressure associated with the point, or synthesized."""
 
-    distance: float
-    """The linear distance from the previous point to this point."""
-
     vector: Tuple[float, float]
     """The motion vector from the previous point to this point."""
 
+    distance: float
+    """The linear distance from the previous point to this point."""
+
     running_length: float
     """The sum of all distances up to this point."""
+
+    @overload
+    def __getitem__(self, key: SupportsIndex) -> Any: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Tuple[Any, ...]: ...
+
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+    def __getitem__(self, key: Union[SupportsIndex, slice, str]) -> Any:
+        if isinstance(key, str):
+            warnings.warn(
+                "Accessing StrokePoint fields by name is deprecated, "
+                "use attribute access instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
@@ -52,7 +52,8 @@ def len(A: S) -> float:
 
 def uni(A: S) -> V:
     """Get normalized / unit vector."""
-    return div(A, len(A))
+    n = hypot(A[0], A[1])
+    return (A[0] / n, A[1] / n)
 
 
 def dist(A: S, B: S) -> float:
@@ -67,7 +68,9 @@ def len2(A: S) -> float:
 
 def dist2(A: S, B: S) -> float:
     """Dist length from A to B squared."""
-    return len2(sub(A, B))
+    dx = A[0] - B[0]
+    dy = A[1] - B[1]
+    return dx * dx + dy * dy
 
 
 def rotAround(A: S, C: S, r: float) -> V:
@@ -92,9 +95,9 @@ def rotAround(A: S, C: S, r: float) -> V:
 
 def lrp(A: S, B: S, t: float) -> V:
     """Interpolate vector A to B with a scalar t"""
-    return add(A, mul(sub(B, A), t))
+    return (A[0] + (B[0] - A[0]) * t, A[1] + (B[1] - A[1]) * t)
 
 
 def prj(A: S, B: S, c: float) -> V:
     """Project a point A in the direction B by a scaler c"""
-    return add(A, mul(B, c))
+    return (A[0] + B[0] * c, A[1] + B[1] * c)
@@ -3,17 +3,44 @@
 # SPDX-License-Identifier: MIT
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List
 
 import pytest
 
 # Using yaml to load "json" documents so I can have things like trailing commas
 import yaml
 
+# The pure-Python yaml parser is slow on the larger test inputs, so use the
+# libyaml-based one when it's available.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
 
-@pytest.fixture(scope="module")
-def shared_datadir(request: pytest.Item) -> Path:
-    return Path(request.fspath).parent / "data"
+from perfect_freehand import get_stroke_points
+from perfect_freehand.types import StrokePoint
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def shared_datadir() -> Path:
+    return Path(__file__).parent / "data"
 
 
 @pytest.fixture
@@ -21,10 +48,11 @@ def datadir(request: pytest.Item) -> Path:
     return Path(request.fspath).with_suffix("")
 
 
-@pytest.fixture(scope="module")
+# The inputs are shared by all of the test modules, so only parse them once.
+@pytest.fixture(scope="session")
 def input_json_all(shared_datadir: Path) -> Any:
     with open(shared_datadir / "inputs.json", "rb") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 @pytest.fixture
@@ -41,6 +69,28 @@ def input_json(input_json_all: Any, request: Any) -> Any:
     return input_json_all[name]
 
 
+@pytest.fixture(scope="session")
+def stroke_points_cache() -> Dict[int, List[StrokePoint]]:
+    return {}
+
+
+@pytest.fixture
+def stroke_points(
+    input_json: Any, stroke_points_cache: Dict[int, List[StrokePoint]]
+) -> List[StrokePoint]:
+    """The stroke points for the input with the default options.
+
+    These are only calculated once per input and are shared between tests, so
+    tests must not modify them. The inputs are kept alive for the whole
+    session by input_json_all, so their ids are stable cache keys.
+    """
+    key = id(input_json)
+    points = stroke_points_cache.get(key)
+    if points is None:
+        points = stroke_points_cache[key] = get_stroke_points(input_json)
+    return points
+
+
 @pytest.fixture
 def output_json(datadir: Path, request: Any) -> Any:
     try:
@@ -49,4 +99,4 @@ def output_json(datadir: Path, request: Any) -> Any:
         filename = request.node.name
 
     with open(datadir / f"output_{filename}.json", "rb") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
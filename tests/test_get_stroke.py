@@ -1,7 +1,7 @@
-import json
+from itertools import chain
 from math import isfinite
 from random import Random
-from typing import Sequence
+from typing import Any, Dict, List, Sequence
 
 import pytest
 
@@ -33,9 +33,29 @@ def test_defaults(
     """It creates a stroke with default values."""
     result = get_stroke(input_json)
     compare_stroke_outline_points(result, output_json)
-    for point in result:
-        assert isfinite(point[0])
-        assert isfinite(point[1])
+    assert all(map(isfinite, chain.from_iterable(result)))
+
+
+@pytest.fixture(scope="module")
+def random_options() -> List[Dict[str, Any]]:
+    """Sets of random options for get_stroke, generated once and shared by
+    all of the inputs."""
+    rng = Random("perfect")
+    return [
+        {
+            "size": rng.uniform(-100, 100),
+            "thinning": rng.uniform(-1, 1),
+            "streamline": rng.uniform(-1, 1),
+            "smoothing": rng.uniform(-1, 1),
+            "simulate_pressure": rng.choices([False, True], cum_weights=[0.25, 1.0])[0],
+            "last": rng.choices([False, True], cum_weights=[0.75, 1.0])[0],
+            "cap_start": rng.choice([False, True]),
+            "taper_start": rng.choice([rng.uniform(-100, 100), 0.0]),
+            "cap_end": rng.choice([False, True]),
+            "taper_end": rng.choice([rng.uniform(-100, 100), 0.0]),
+        }
+        for _ in range(500)
+    ]
 
 
 @pytest.mark.parametrize(
@@ -56,42 +76,20 @@ def test_defaults(
     ],
     indirect=True,
 )
-def test_random(input_json: Sequence[Sequence[float]]) -> None:
+@pytest.mark.parametrize(
+    ("count"),
+    [50, pytest.param(500, marks=pytest.mark.slow)],
+)
+def test_random(
+    input_json: Sequence[Sequence[float]],
+    random_options: List[Dict[str, Any]],
+    count: int,
+) -> None:
     """It creates a stroke with random options."""
-    rng = Random("perfect")
-
-    for i in range(500):
-        size = rng.uniform(-100, 100)
-        thinning = rng.uniform(-1, 1)
-        streamline = rng.uniform(-1, 1)
-        smoothing = rng.uniform(-1, 1)
-        simulate_pressure = rng.choices([False, True], cum_weights=[0.25, 1.0])[0]
-        last = rng.choices([False, True], cum_weights=[0.75, 1.0])[0]
-        cap_start = rng.choice([False, True])
-        taper_start = rng.choice([rng.uniform(-100, 100), 0.0])
-        cap_end = rng.choice([False, True])
-        taper_end = rng.choice([rng.uniform(-100, 100), 0.0])
-        print(
-            f"options: size={size}, thinning={thinning}, streamline={streamline}, smoothing={smoothing}, last={last}, cap_start={cap_start}, taper_start={taper_start}, cap_end={cap_end}, taper_end={taper_end}"
-        )
-
-        result = get_stroke(
-            input_json,
-            size=size,
-            thinning=thinning,
-            streamline=streamline,
-            smoothing=smoothing,
-            simulate_pressure=simulate_pressure,
-            last=last,
-            cap_start=cap_start,
-            taper_start=taper_start,
-            cap_end=cap_end,
-            taper_end=taper_end,
-        )
+    for options in random_options[:count]:
+        result = get_stroke(input_json, **options)
 
-        for point in result:
-            assert isfinite(point[0])
-            assert isfinite(point[1])
+        assert all(map(isfinite, chain.from_iterable(result))), f"options: {options}"
 
 
 def test_no_points(output_json: Sequence[Sequence[float]]) -> None:
@@ -3,23 +3,26 @@
 #
 # SPDX-License-Identifier: MIT
 
-import json
+from itertools import chain
 from math import isfinite
 from typing import Sequence
 
 import pytest
 from pytest import approx
 
-from perfect_freehand import get_stroke_outline_points, get_stroke_points
+from perfect_freehand import get_stroke_outline_points
+from perfect_freehand.types import StrokePoint
 
 
 def compare_stroke_outline_points(
     points: Sequence[Sequence[float]], ref_points: Sequence[Sequence[float]]
 ) -> None:
     assert len(points) == len(ref_points)
-    for A, B in zip(points, ref_points):
-        assert A[0] == approx(B[0])
-        assert A[1] == approx(B[1])
+    # Compare all of the coordinates with a single approx, rather than
+    # creating one for each coordinate.
+    assert list(chain.from_iterable(points)) == approx(
+        list(chain.from_iterable(ref_points))
+    )
 
 
 @pytest.mark.parametrize(
@@ -40,53 +43,87 @@ def compare_stroke_outline_points(
     ],
     indirect=True,
 )
-def test_no_nan_values(input_json: Sequence[Sequence[float]]) -> None:
+def test_no_nan_values(stroke_points: Sequence[StrokePoint]) -> None:
     """Run over many example input files without generating NaN values."""
-    for point in get_stroke_outline_points(get_stroke_points(input_json)):
-        assert isfinite(point[0])
-        assert isfinite(point[1])
+    points = get_stroke_outline_points(stroke_points)
+    assert all(map(isfinite, chain.from_iterable(points)))
 
 
 @pytest.mark.input_json("onePoint")
 def test_one_point(
-    input_json: Sequence[Sequence[float]], output_json: Sequence[Sequence[float]]
+    stroke_points: Sequence[StrokePoint], output_json: Sequence[Sequence[float]]
 ) -> None:
     """Get stroke outline points with a single point."""
-    points = get_stroke_outline_points(get_stroke_points(input_json))
+    points = get_stroke_outline_points(stroke_points)
     compare_stroke_outline_points(points, output_json)
 
 
 @pytest.mark.input_json("twoPoints")
 def test_two_points(
-    input_json: Sequence[Sequence[float]], output_json: Sequence[Sequence[float]]
+    stroke_points: Sequence[StrokePoint], output_json: Sequence[Sequence[float]]
 ) -> None:
     """Get stroke outline points with two points."""
-    points = get_stroke_outline_points(get_stroke_points(input_json))
+    points = get_stroke_outline_points(stroke_points)
     compare_stroke_outline_points(points, output_json)
 
 
 @pytest.mark.input_json("twoEqualPoints")
 def test_two_equal_points(
-    input_json: Sequence[Sequence[float]], output_json: Sequence[Sequence[float]]
+    stroke_points: Sequence[StrokePoint], output_json: Sequence[Sequence[float]]
 ) -> None:
     """Get stroke outline points from a line with two equal points."""
-    points = get_stroke_outline_points(get_stroke_points(input_json))
+    points = get_stroke_outline_points(stroke_points)
     compare_stroke_outline_points(points, output_json)
 
 
 @pytest.mark.input_json("manyPoints")
 def test_many_points(
-    input_json: Sequence[Sequence[float]], output_json: Sequence[Sequence[float]]
+    stroke_points: Sequence[StrokePoint], output_json: Sequence[Sequence[float]]
 ) -> None:
     """Get stroke outline points on a line with many points."""
-    points = get_stroke_outline_points(get_stroke_points(input_json))
+    points = get_stroke_outline_points(stroke_points)
     compare_stroke_outline_points(points, output_json)
 
 
 @pytest.mark.input_json("withDuplicates")
 def test_with_duplicates(
-    input_json: Sequence[Sequence[float]], output_json: Sequence[Sequence[float]]
+    stroke_points: Sequence[StrokePoint], output_json: Sequence[Sequence[float]]
 ) -> None:
     """Get stroke points from a line with duplicates."""
-    points = get_stroke_outline_points(get_stroke_points(input_json))
+    points = get_stroke_outline_points(stroke_points)
     compare_stroke_outline_points(points, output_json)
+
+
+@pytest.mark.input_json("scribble")
+def test_default_easing(stroke_points: Sequence[StrokePoint]) -> None:
+    """The default easing gives the same outline as an identity easing."""
+    for thinning in (-0.7, 0.0, 0.5, 1.0):
+        points = get_stroke_outline_points(stroke_points, thinning=thinning)
+        ref_points = get_stroke_outline_points(
+            stroke_points, thinning=thinning, easing=lambda t: t
+        )
+        compare_stroke_outline_points(points, ref_points)
+
+
+@pytest.mark.input_json("manyPoints")
+def test_deprecated_dict_points(stroke_points: Sequence[StrokePoint]) -> None:
+    """Stroke points passed as dicts still give the same outline, with a warning."""
+    dict_points = [point._asdict() for point in stroke_points]
+    with pytest.deprecated_call():
+        points = get_stroke_outline_points(dict_points)  # type: ignore[arg-type]
+    compare_stroke_outline_points(points, get_stroke_outline_points(stroke_points))
+
+
+@pytest.mark.parametrize(
+    ("input_json"),
+    ["manyPoints", "waves", "corners", "scribble"],
+    indirect=True,
+)
+def test_simplify(stroke_points: Sequence[StrokePoint]) -> None:
+    """Simplifying removes points from the outline without generating NaN values."""
+    points = get_stroke_outline_points(stroke_points)
+    simplified = get_stroke_outline_points(stroke_points, simplify=True)
+    assert len(simplified) < len(points)
+    assert simplified[0] == points[0]
+    assert simplified[-1] == points[-1]
+    assert all(map(isfinite, chain.from_iterable(simplified)))
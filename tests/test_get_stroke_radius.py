@@ -77,3 +77,15 @@ def test_easing_exponential_thinning_negative_one() -> None:
     assert get_stroke_radius(100.0, -1.0, 0.5, easing) == approx(25.0)
     assert get_stroke_radius(100.0, -1.0, 0.75, easing) == approx(6.25)
     assert get_stroke_radius(100.0, -1.0, 1.0, easing) == approx(0.0)
+
+
+def test_default_easing_linear() -> None:
+    """With the default easing the radius is linear in the pressure, which
+    get_stroke_outline_points relies on to avoid calling it for every point."""
+    for thinning in (-1.0, -0.5, 0.0, 0.3, 0.5, 1.0):
+        base = 16.0 * (0.5 - 0.5 * thinning)
+        scale = 16.0 * thinning
+        for pressure in (0.0, 0.1, 0.25, 0.5, 0.8, 1.0):
+            assert get_stroke_radius(16.0, thinning, pressure) == approx(
+                base + scale * pressure
+            )
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2022 Calvin Walton
+#
+# SPDX-License-Identifier: MIT
+
+from typing import List, Sequence
+
+import pytest
+
+from perfect_freehand import get_stroke, svg_path_from_stroke
+
+
+def reference_svg_path_from_stroke(stroke: Sequence[Sequence[float]]) -> str:
+    """The svg_path_from_stroke() example from the original documentation."""
+    if len(stroke) == 0:
+        return ""
+
+    d: List[str] = ["M", f"{stroke[0][0]}", f"{stroke[0][1]}", "Q"]
+    for (x0, y0), (x1, y1) in zip(stroke, [*stroke[1:], stroke[0]]):
+        d.extend([f"{(x0 + x1) / 2}", f"{(y0 + y1) / 2}", f"{x1}", f"{y1}"])
+
+    d.append("Z")
+    return " ".join(d)
+
+
+def test_no_points() -> None:
+    """It creates an empty path from a stroke with no points."""
+    assert svg_path_from_stroke([]) == ""
+
+
+def test_square() -> None:
+    """It creates a closed path of curves through the midpoints."""
+    stroke = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+    assert svg_path_from_stroke(stroke) == (
+        "M 0.0 0.0 Q 1.0 0.0 2.0 0.0 2.0 1.0 2.0 2.0 1.0 2.0 0.0 2.0 "
+        "0.0 1.0 0.0 0.0 Z"
+    )
+
+
+@pytest.mark.parametrize(
+    ("input_json"),
+    ["onePoint", "twoPoints", "manyPoints", "scribble"],
+    indirect=True,
+)
+def test_matches_reference(input_json: Sequence[Sequence[float]]) -> None:
+    """It creates the same path as the example from the documentation."""
+    stroke = get_stroke(input_json)
+    assert svg_path_from_stroke(stroke) == reference_svg_path_from_stroke(stroke)
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2022 Calvin Walton
+#
+# SPDX-License-Identifier: MIT
+
+from math import sqrt
+from typing import Sequence
+
+import pytest
+from pytest import approx
+
+from perfect_freehand import vec
+
+
+@pytest.mark.parametrize(
+    ("input_json"),
+    ["manyPoints", "scribble", "waves"],
+    indirect=True,
+)
+def test_dist_len(input_json: Sequence[Sequence[float]]) -> None:
+    """Distances and lengths match the plain square root formula."""
+    for A, B in zip(input_json, input_json[1:]):
+        dx = A[0] - B[0]
+        dy = A[1] - B[1]
+        expected = sqrt(dx * dx + dy * dy)
+        assert vec.dist(A, B) == approx(expected)
+        assert vec.dist(B, A) == vec.dist(A, B)
+        assert vec.len(vec.sub(A, B)) == approx(expected)
+        assert vec.dist2(A, B) == approx(dx * dx + dy * dy)
+
+
+def test_uni() -> None:
+    """Unit vectors have a length of one."""
+    assert vec.uni((3.0, 4.0)) == approx((0.6, 0.8))
+    assert vec.uni((-5.0, 0.0)) == approx((-1.0, 0.0))
+    assert vec.len(vec.uni((1e-3, 2e-3))) == approx(1.0)
+
+
+def test_lrp_prj() -> None:
+    """Interpolation and projection match the composed vector operations."""
+    A = (1.0, 2.0)
+    B = (5.0, -6.0)
+    assert vec.lrp(A, B, 0.0) == A
+    assert vec.lrp(A, B, 1.0) == B
+    assert vec.lrp(A, B, 0.25) == vec.add(A, vec.mul(vec.sub(B, A), 0.25))
+    assert vec.prj(A, B, 0.5) == vec.add(A, vec.mul(B, 0.5))